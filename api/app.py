@@ -1,17 +1,53 @@
 """Flask application for pyFishTank REST API."""
 
 from datetime import date, datetime
-from uuid import UUID
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Optional
+from uuid import UUID, uuid4
 
-from flask import Flask, jsonify, request
-from flask_cors import CORS
+import orjson
+from flask import Flask, request, stream_with_context
+from flask.json.provider import JSONProvider
 
 from models import Fish, MaintenanceLog, Tank, WaterParameters
 from services.data_manager import DataManager
 from services.managers import FishManager, MaintenanceManager, TankManager
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson.
+
+    Routes encode their responses with orjson directly (see json_response);
+    Flask itself only goes through the provider to parse request bodies.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
-CORS(app)
+app.json = OrjsonProvider(app)
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Allow the separately served frontend to call the API."""
+    response.headers["Access-Control-Allow-Origin"] = "*"
+    response.headers["Access-Control-Allow-Headers"] = "Content-Type"
+    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
+    return response
+
+
+# Prefix for ETags, so tags handed out before a restart never match
+_ETAG_PREFIX = uuid4().hex[:8]
+
+# Summary report template with every health status present
+_ZERO_HEALTH_COUNTS = dict.fromkeys(Fish.VALID_HEALTH_STATUSES, 0)
 
 # Initialize managers
 data_manager = DataManager()
@@ -20,18 +56,119 @@ fish_manager = FishManager(data_manager)
 maintenance_manager = MaintenanceManager(data_manager)
 
 
+@app.after_request
+def release_connection(response):
+    """Return the request's connection to the pool once the response is sent.
+
+    Deferred to close rather than teardown so streamed bodies finish reading
+    their cursor before the connection can go to another request.
+    """
+    response.call_on_close(data_manager.release)
+    return response
+
+
 # Helper functions
+@lru_cache(maxsize=4096)
 def parse_uuid(uuid_str: str) -> UUID:
-    """Parse a UUID string."""
+    """Parse a UUID string, memoized since clients repeat the same IDs."""
     return UUID(uuid_str)
 
 
+@lru_cache(maxsize=1024)
+def parse_date(date_str: str) -> date:
+    """Parse an ISO date string, memoized for bulk imports."""
+    return date.fromisoformat(date_str)
+
+
+def json_bytes_response(body: bytes, status: int = 200):
+    """Wrap pre-encoded JSON bytes in a response."""
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
+def json_response(obj, status: int = 200):
+    """Encode data straight to a JSON response, bypassing jsonify."""
+    return json_bytes_response(orjson.dumps(obj), status)
+
+
+def versioned_json_response(state: tuple[int, int], encode: Callable[[], bytes]):
+    """Serve JSON with a weak ETag derived from the data state.
+
+    The state is the one ``encode`` caches its body under, so the tag
+    always names the body it was sent with. Returns 304 without encoding
+    anything when the client's copy is current.
+    """
+    etag = "-".join(map(str, (_ETAG_PREFIX, *state)))
+    if request.if_none_match.contains_weak(etag):
+        return app.response_class(status=304)
+    response = json_bytes_response(encode())
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def _encode_array(items: Iterable) -> Iterator[bytes]:
+    """Encode items as a JSON array one element at a time."""
+    yield b"["
+    for i, item in enumerate(items):
+        if i:
+            yield b","
+        yield orjson.dumps(item)
+    yield b"]"
+
+
+def json_stream_response(items: Iterable):
+    """Stream items as a JSON array without building the whole body."""
+    return app.response_class(
+        stream_with_context(_encode_array(items)), mimetype="application/json"
+    )
+
+
+# Serialized response cache. Entries are keyed by the DataManager state they
+# were built under, which moves only once a write has been committed, by
+# this process or another, so any write leaves them unreachable and they
+# age out of the LRU.
+@lru_cache(maxsize=32)
+def _tanks_json(state: tuple[int, int]) -> bytes:
+    """Encode all tanks; current parameters also depend on maintenance logs."""
+    return orjson.dumps(tank_manager.get_all())
+
+
+@lru_cache(maxsize=128)
+def _fish_json(tank_id: Optional[UUID], state: tuple[int, int]) -> bytes:
+    """Encode all fish, or the fish in one tank."""
+    if tank_id:
+        return orjson.dumps(fish_manager.get_by_tank(tank_id))
+    return orjson.dumps(fish_manager.get_all())
+
+
+@lru_cache(maxsize=32)
+def _summary_json(state: tuple[int, int]) -> bytes:
+    """Encode the summary report of all tanks."""
+    health_by_tank = fish_manager.health_counts_by_tank()
+    stats_by_tank = maintenance_manager.stats_by_tank()
+    summary = []
+
+    for tank in tank_manager.get_all():
+        health_counts = _ZERO_HEALTH_COUNTS.copy()
+        health_counts.update(health_by_tank.get(tank.id, {}))
+        maintenance_count, last_maintenance = stats_by_tank.get(tank.id, (0, None))
+
+        summary.append({
+            "tank": tank,
+            "fish_count": sum(health_counts.values()),
+            "health_counts": health_counts,
+            "maintenance_count": maintenance_count,
+            "last_maintenance": last_maintenance,
+        })
+
+    return orjson.dumps(summary)
+
+
 # Tank routes
 @app.route("/api/tanks", methods=["GET"])
 def get_tanks():
     """Get all tanks."""
-    tanks = tank_manager.get_all()
-    return jsonify([t.to_dict() for t in tanks])
+    state = data_manager.state()
+    return versioned_json_response(state, lambda: _tanks_json(state))
 
 
 @app.route("/api/tanks/<tank_id>", methods=["GET"])
@@ -39,8 +176,8 @@ def get_tank(tank_id: str):
     """Get a specific tank."""
     tank = tank_manager.get_by_id(parse_uuid(tank_id))
     if not tank:
-        return jsonify({"error": "Tank not found"}), 404
-    return jsonify(tank.to_dict())
+        return json_response({"error": "Tank not found"}, 404)
+    return json_response(tank)
 
 
 @app.route("/api/tanks", methods=["POST"])
@@ -56,9 +193,9 @@ def create_tank():
             equipment=data.get("equipment", []),
         )
         tank_manager.add(tank)
-        return jsonify(tank.to_dict()), 201
+        return json_response(tank, 201)
     except (KeyError, ValueError) as e:
-        return jsonify({"error": str(e)}), 400
+        return json_response({"error": str(e)}, 400)
 
 
 @app.route("/api/tanks/<tank_id>", methods=["PUT"])
@@ -67,7 +204,7 @@ def update_tank(tank_id: str):
     data = request.json
     tank = tank_manager.get_by_id(parse_uuid(tank_id))
     if not tank:
-        return jsonify({"error": "Tank not found"}), 404
+        return json_response({"error": "Tank not found"}, 404)
 
     try:
         updated_tank = Tank(
@@ -80,9 +217,9 @@ def update_tank(tank_id: str):
             current_parameters=tank.current_parameters,
         )
         tank_manager.update(updated_tank)
-        return jsonify(updated_tank.to_dict())
+        return json_response(updated_tank)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return json_response({"error": str(e)}, 400)
 
 
 @app.route("/api/tanks/<tank_id>", methods=["DELETE"])
@@ -91,13 +228,14 @@ def delete_tank(tank_id: str):
     uuid = parse_uuid(tank_id)
     tank = tank_manager.get_by_id(uuid)
     if not tank:
-        return jsonify({"error": "Tank not found"}), 404
+        return json_response({"error": "Tank not found"}, 404)
 
-    # Cascade delete
-    fish_manager.delete_by_tank(uuid)
-    maintenance_manager.delete_by_tank(uuid)
-    tank_manager.delete(uuid)
-    return jsonify({"message": "Tank deleted"}), 200
+    # Cascade delete, committed together
+    with data_manager.transaction():
+        fish_manager.delete_by_tank(uuid)
+        maintenance_manager.delete_by_tank(uuid)
+        tank_manager.delete(uuid)
+    return json_response({"message": "Tank deleted"}, 200)
 
 
 @app.route("/api/tanks/<tank_id>/water-params", methods=["PUT"])
@@ -107,7 +245,7 @@ def update_water_params(tank_id: str):
     uuid = parse_uuid(tank_id)
     tank = tank_manager.get_by_id(uuid)
     if not tank:
-        return jsonify({"error": "Tank not found"}), 404
+        return json_response({"error": "Tank not found"}, 404)
 
     params = WaterParameters(
         temperature=data.get("temperature"),
@@ -118,7 +256,7 @@ def update_water_params(tank_id: str):
         salinity=data.get("salinity"),
     )
     tank_manager.update_water_params(uuid, params)
-    return jsonify(params.to_dict())
+    return json_response(params)
 
 
 # Fish routes
@@ -126,11 +264,9 @@ def update_water_params(tank_id: str):
 def get_all_fish():
     """Get all fish, optionally filtered by tank."""
     tank_id = request.args.get("tank_id")
-    if tank_id:
-        fish = fish_manager.get_by_tank(parse_uuid(tank_id))
-    else:
-        fish = fish_manager.get_all()
-    return jsonify([f.to_dict() for f in fish])
+    tank_uuid = parse_uuid(tank_id) if tank_id else None
+    state = data_manager.state()
+    return versioned_json_response(state, lambda: _fish_json(tank_uuid, state))
 
 
 @app.route("/api/fish/<fish_id>", methods=["GET"])
@@ -138,30 +274,46 @@ def get_fish(fish_id: str):
     """Get a specific fish."""
     fish = fish_manager.get_by_id(parse_uuid(fish_id))
     if not fish:
-        return jsonify({"error": "Fish not found"}), 404
-    return jsonify(fish.to_dict())
+        return json_response({"error": "Fish not found"}, 404)
+    return json_response(fish)
+
+
+def _new_fish(data: dict) -> Fish:
+    """Build a new fish from request data."""
+    return Fish(
+        name=data["name"],
+        species=data["species"],
+        tank_id=parse_uuid(data["tank_id"]),
+        health_status=data.get("health_status", "healthy"),
+        size=data.get("size"),
+        color=data.get("color"),
+        feeding_preferences=data.get("feeding_preferences"),
+        notes=data.get("notes"),
+        birth_date=parse_date(data["birth_date"]) if data.get("birth_date") else None,
+    )
 
 
 @app.route("/api/fish", methods=["POST"])
 def create_fish():
-    """Create a new fish."""
+    """Create a new fish, or several when given a list."""
     data = request.json
+    if isinstance(data, list):
+        for i, item in enumerate(data):
+            if not isinstance(item, dict):
+                return json_response({"error": f"Item {i} is not an object"}, 400)
+    elif not isinstance(data, dict):
+        return json_response({"error": "Expected an object or a list of objects"}, 400)
+
     try:
-        fish = Fish(
-            name=data["name"],
-            species=data["species"],
-            tank_id=parse_uuid(data["tank_id"]),
-            health_status=data.get("health_status", "healthy"),
-            size=data.get("size"),
-            color=data.get("color"),
-            feeding_preferences=data.get("feeding_preferences"),
-            notes=data.get("notes"),
-            birth_date=date.fromisoformat(data["birth_date"]) if data.get("birth_date") else None,
-        )
+        if isinstance(data, list):
+            fish_list = [_new_fish(item) for item in data]
+            fish_manager.add_many(fish_list)
+            return json_response(fish_list, 201)
+        fish = _new_fish(data)
         fish_manager.add(fish)
-        return jsonify(fish.to_dict()), 201
+        return json_response(fish, 201)
     except (KeyError, ValueError) as e:
-        return jsonify({"error": str(e)}), 400
+        return json_response({"error": str(e)}, 400)
 
 
 @app.route("/api/fish/<fish_id>", methods=["PUT"])
@@ -170,7 +322,7 @@ def update_fish(fish_id: str):
     data = request.json
     fish = fish_manager.get_by_id(parse_uuid(fish_id))
     if not fish:
-        return jsonify({"error": "Fish not found"}), 404
+        return json_response({"error": "Fish not found"}, 404)
 
     try:
         updated_fish = Fish(
@@ -179,7 +331,7 @@ def update_fish(fish_id: str):
             species=data.get("species", fish.species),
             tank_id=parse_uuid(data["tank_id"]) if "tank_id" in data else fish.tank_id,
             date_added=fish.date_added,
-            birth_date=date.fromisoformat(data["birth_date"]) if data.get("birth_date") else fish.birth_date,
+            birth_date=parse_date(data["birth_date"]) if data.get("birth_date") else fish.birth_date,
             health_status=data.get("health_status", fish.health_status),
             size=data.get("size", fish.size),
             color=data.get("color", fish.color),
@@ -187,17 +339,17 @@ def update_fish(fish_id: str):
             notes=data.get("notes", fish.notes),
         )
         fish_manager.update(updated_fish)
-        return jsonify(updated_fish.to_dict())
+        return json_response(updated_fish)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return json_response({"error": str(e)}, 400)
 
 
 @app.route("/api/fish/<fish_id>", methods=["DELETE"])
 def delete_fish(fish_id: str):
     """Delete a fish."""
     if not fish_manager.delete(parse_uuid(fish_id)):
-        return jsonify({"error": "Fish not found"}), 404
-    return jsonify({"message": "Fish deleted"}), 200
+        return json_response({"error": "Fish not found"}, 404)
+    return json_response({"message": "Fish deleted"}, 200)
 
 
 @app.route("/api/fish/<fish_id>/move", methods=["POST"])
@@ -205,8 +357,8 @@ def move_fish(fish_id: str):
     """Move a fish to a different tank."""
     data = request.json
     if not fish_manager.move_to_tank(parse_uuid(fish_id), parse_uuid(data["tank_id"])):
-        return jsonify({"error": "Fish not found"}), 404
-    return jsonify({"message": "Fish moved"})
+        return json_response({"error": "Fish not found"}, 404)
+    return json_response({"message": "Fish moved"})
 
 
 @app.route("/api/fish/<fish_id>/health", methods=["PUT"])
@@ -214,8 +366,8 @@ def update_fish_health(fish_id: str):
     """Update a fish's health status."""
     data = request.json
     if not fish_manager.update_health_status(parse_uuid(fish_id), data["health_status"]):
-        return jsonify({"error": "Fish not found or invalid status"}), 400
-    return jsonify({"message": "Health status updated"})
+        return json_response({"error": "Fish not found or invalid status"}, 400)
+    return json_response({"message": "Health status updated"})
 
 
 # Maintenance routes
@@ -226,19 +378,55 @@ def get_maintenance_logs():
     activity_type = request.args.get("activity_type")
     limit = request.args.get("limit", type=int)
 
+    # Rows are converted as the response is written, not collected up front
     if activity_type:
-        logs = maintenance_manager.get_by_activity_type(
+        logs = maintenance_manager.iter_by_activity_type(
             activity_type,
             parse_uuid(tank_id) if tank_id else None
         )
     elif tank_id:
-        logs = maintenance_manager.get_by_tank(parse_uuid(tank_id))
+        logs = maintenance_manager.iter_by_tank(parse_uuid(tank_id))
     elif limit:
         logs = maintenance_manager.get_recent(limit)
     else:
-        logs = maintenance_manager.get_all()
+        logs = maintenance_manager.iter_all()
+
+    return json_stream_response(logs)
 
-    return jsonify([log.to_dict() for log in logs])
+
+def _log_water_test(tank_id: UUID, description: str, data: dict) -> MaintenanceLog:
+    """Log a water test from request data."""
+    params_data = data.get("water_params", {})
+    params = WaterParameters(
+        temperature=params_data.get("temperature"),
+        ph=params_data.get("ph"),
+        ammonia=params_data.get("ammonia"),
+        nitrite=params_data.get("nitrite"),
+        nitrate=params_data.get("nitrate"),
+        salinity=params_data.get("salinity"),
+    )
+    return maintenance_manager.log_water_test(tank_id, params, description)
+
+
+# Maintenance log creators keyed by activity type
+_MAINTENANCE_LOGGERS = {
+    "water_change": lambda tank_id, description, data: (
+        maintenance_manager.log_water_change(tank_id, description, data.get("percentage"))
+    ),
+    "feeding": lambda tank_id, description, data: (
+        maintenance_manager.log_feeding(tank_id, description)
+    ),
+    "filter_clean": lambda tank_id, description, data: (
+        maintenance_manager.log_filter_clean(tank_id, description)
+    ),
+    "equipment_check": lambda tank_id, description, data: (
+        maintenance_manager.log_equipment_check(tank_id, description)
+    ),
+    "medication": lambda tank_id, description, data: (
+        maintenance_manager.log_medication(tank_id, description)
+    ),
+    "water_test": _log_water_test,
+}
 
 
 @app.route("/api/maintenance", methods=["POST"])
@@ -249,36 +437,15 @@ def create_maintenance_log():
     activity_type = data["activity_type"]
     description = data.get("description", "")
 
+    log_activity = _MAINTENANCE_LOGGERS.get(activity_type)
+    if log_activity is None:
+        return json_response({"error": f"Invalid activity type: {activity_type}"}, 400)
+
     try:
-        if activity_type == "water_change":
-            log = maintenance_manager.log_water_change(
-                tank_id, description, data.get("percentage")
-            )
-        elif activity_type == "feeding":
-            log = maintenance_manager.log_feeding(tank_id, description)
-        elif activity_type == "filter_clean":
-            log = maintenance_manager.log_filter_clean(tank_id, description)
-        elif activity_type == "equipment_check":
-            log = maintenance_manager.log_equipment_check(tank_id, description)
-        elif activity_type == "medication":
-            log = maintenance_manager.log_medication(tank_id, description)
-        elif activity_type == "water_test":
-            params_data = data.get("water_params", {})
-            params = WaterParameters(
-                temperature=params_data.get("temperature"),
-                ph=params_data.get("ph"),
-                ammonia=params_data.get("ammonia"),
-                nitrite=params_data.get("nitrite"),
-                nitrate=params_data.get("nitrate"),
-                salinity=params_data.get("salinity"),
-            )
-            log = maintenance_manager.log_water_test(tank_id, params, description)
-        else:
-            return jsonify({"error": f"Invalid activity type: {activity_type}"}), 400
-
-        return jsonify(log.to_dict()), 201
+        log = log_activity(tank_id, description, data)
+        return json_response(log, 201)
     except ValueError as e:
-        return jsonify({"error": str(e)}), 400
+        return json_response({"error": str(e)}, 400)
 
 
 @app.route("/api/tanks/<tank_id>/water-params/history", methods=["GET"])
@@ -286,40 +453,20 @@ def get_water_param_history(tank_id: str):
     """Get water parameter history for a tank."""
     limit = request.args.get("limit", 10, type=int)
     params = maintenance_manager.get_water_param_history(parse_uuid(tank_id), limit)
-    return jsonify([p.to_dict() for p in params])
+    return json_response(params)
 
 
 # Reports endpoints
 @app.route("/api/reports/summary", methods=["GET"])
 def get_summary_report():
     """Get a summary report of all tanks."""
-    tanks = tank_manager.get_all()
-    summary = []
-
-    for tank in tanks:
-        fish_list = fish_manager.get_by_tank(tank.id)
-        logs = maintenance_manager.get_by_tank(tank.id)
-
-        health_counts = {"healthy": 0, "sick": 0, "recovering": 0, "deceased": 0}
-        for fish in fish_list:
-            health_counts[fish.health_status] += 1
-
-        last_maintenance = logs[0].date.isoformat() if logs else None
-
-        summary.append({
-            "tank": tank.to_dict(),
-            "fish_count": len(fish_list),
-            "health_counts": health_counts,
-            "maintenance_count": len(logs),
-            "last_maintenance": last_maintenance,
-        })
-
-    return jsonify(summary)
+    state = data_manager.state()
+    return versioned_json_response(state, lambda: _summary_json(state))
 
 
 def run_server(host="127.0.0.1", port=5001, debug=True):
-    """Run the Flask development server."""
-    app.run(host=host, port=port, debug=debug)
+    """Run the Flask development server, one thread per request."""
+    app.run(host=host, port=port, debug=debug, threaded=True)
 
 
 if __name__ == "__main__":
@@ -5,8 +5,15 @@ from datetime import date
 from typing import Optional
 from uuid import UUID, uuid4
 
+_STATUS_ICONS = {
+    "healthy": "✓",
+    "sick": "✗",
+    "recovering": "↻",
+    "deceased": "†",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class Fish:
     """Represents a fish in a tank."""
 
@@ -23,31 +30,16 @@ class Fish:
     notes: Optional[str] = None
 
     VALID_HEALTH_STATUSES = ("healthy", "sick", "recovering", "deceased")
+    HEALTH_STATUS_SET = frozenset(VALID_HEALTH_STATUSES)
 
     def __post_init__(self):
         """Validate fields after initialization."""
-        if self.health_status not in self.VALID_HEALTH_STATUSES:
+        if self.health_status not in self.HEALTH_STATUS_SET:
             raise ValueError(
                 f"Invalid health status: {self.health_status}. "
                 f"Must be one of {self.VALID_HEALTH_STATUSES}"
             )
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "species": self.species,
-            "tank_id": str(self.tank_id),
-            "date_added": self.date_added.isoformat(),
-            "birth_date": self.birth_date.isoformat() if self.birth_date else None,
-            "health_status": self.health_status,
-            "size": self.size,
-            "color": self.color,
-            "feeding_preferences": self.feeding_preferences,
-            "notes": self.notes,
-        }
-
     @classmethod
     def from_dict(cls, data: dict) -> "Fish":
         """Create instance from dictionary."""
@@ -67,10 +59,5 @@ class Fish:
 
     def __str__(self) -> str:
         """Human-readable string representation."""
-        status_icon = {
-            "healthy": "✓",
-            "sick": "✗",
-            "recovering": "↻",
-            "deceased": "†",
-        }.get(self.health_status, "?")
+        status_icon = _STATUS_ICONS.get(self.health_status, "?")
         return f"{self.name} ({self.species}) [{status_icon}]"
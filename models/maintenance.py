@@ -7,8 +7,17 @@ from uuid import UUID, uuid4
 
 from .water_params import WaterParameters
 
+_ACTIVITY_DISPLAY_NAMES = {
+    "water_change": "Water Change",
+    "filter_clean": "Filter Cleaning",
+    "feeding": "Feeding",
+    "water_test": "Water Test",
+    "equipment_check": "Equipment Check",
+    "medication": "Medication",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class MaintenanceLog:
     """Represents a maintenance activity for a tank."""
 
@@ -27,26 +36,16 @@ class MaintenanceLog:
         "equipment_check",
         "medication",
     )
+    ACTIVITY_TYPE_SET = frozenset(VALID_ACTIVITY_TYPES)
 
     def __post_init__(self):
         """Validate fields after initialization."""
-        if self.activity_type not in self.VALID_ACTIVITY_TYPES:
+        if self.activity_type not in self.ACTIVITY_TYPE_SET:
             raise ValueError(
                 f"Invalid activity type: {self.activity_type}. "
                 f"Must be one of {self.VALID_ACTIVITY_TYPES}"
             )
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "id": str(self.id),
-            "tank_id": str(self.tank_id),
-            "date": self.date.isoformat(),
-            "activity_type": self.activity_type,
-            "description": self.description,
-            "water_params": self.water_params.to_dict() if self.water_params else None,
-        }
-
     @classmethod
     def from_dict(cls, data: dict) -> "MaintenanceLog":
         """Create instance from dictionary."""
@@ -66,14 +65,7 @@ class MaintenanceLog:
     @property
     def activity_display_name(self) -> str:
         """Get human-readable activity type name."""
-        return {
-            "water_change": "Water Change",
-            "filter_clean": "Filter Cleaning",
-            "feeding": "Feeding",
-            "water_test": "Water Test",
-            "equipment_check": "Equipment Check",
-            "medication": "Medication",
-        }.get(self.activity_type, self.activity_type)
+        return _ACTIVITY_DISPLAY_NAMES.get(self.activity_type, self.activity_type)
 
     def __str__(self) -> str:
         """Human-readable string representation."""
@@ -7,7 +7,7 @@ from uuid import UUID, uuid4
 from .water_params import WaterParameters
 
 
-@dataclass
+@dataclass(slots=True)
 class Tank:
     """Represents a fish tank."""
 
@@ -20,10 +20,11 @@ class Tank:
     current_parameters: Optional[WaterParameters] = None
 
     VALID_TANK_TYPES = ("freshwater", "saltwater", "brackish")
+    TANK_TYPE_SET = frozenset(VALID_TANK_TYPES)
 
     def __post_init__(self):
         """Validate fields after initialization."""
-        if self.tank_type not in self.VALID_TANK_TYPES:
+        if self.tank_type not in self.TANK_TYPE_SET:
             raise ValueError(
                 f"Invalid tank type: {self.tank_type}. "
                 f"Must be one of {self.VALID_TANK_TYPES}"
@@ -31,20 +32,6 @@ class Tank:
         if self.size_gallons <= 0:
             raise ValueError("Tank size must be positive")
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "size_gallons": self.size_gallons,
-            "tank_type": self.tank_type,
-            "location": self.location,
-            "equipment": self.equipment,
-            "current_parameters": (
-                self.current_parameters.to_dict() if self.current_parameters else None
-            ),
-        }
-
     @classmethod
     def from_dict(cls, data: dict) -> "Tank":
         """Create instance from dictionary."""
@@ -62,6 +49,11 @@ class Tank:
             ),
         )
 
+    @property
+    def equipment_str(self) -> str:
+        """Equipment as a comma-separated string, for display."""
+        return ", ".join(self.equipment)
+
     def __str__(self) -> str:
         """Human-readable string representation."""
         return f"{self.name} ({self.size_gallons}gal {self.tank_type})"
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class WaterParameters:
     """Represents water quality parameters for a fish tank."""
 
@@ -17,18 +17,6 @@ class WaterParameters:
     nitrate: Optional[float] = None  # ppm
     salinity: Optional[float] = None  # ppt, for saltwater tanks
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "date_tested": self.date_tested.isoformat(),
-            "temperature": self.temperature,
-            "ph": self.ph,
-            "ammonia": self.ammonia,
-            "nitrite": self.nitrite,
-            "nitrate": self.nitrate,
-            "salinity": self.salinity,
-        }
-
     @classmethod
     def from_dict(cls, data: dict) -> "WaterParameters":
         """Create instance from dictionary."""
@@ -1,8 +1,108 @@
 """Data manager for SQLite database operations."""
 
 import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional
+from uuid import UUID
+
+import orjson
+
+# Stored in PRAGMA user_version; bump it alongside a step in DataManager._migrate
+SCHEMA_VERSION = 3
+
+# Idle connections kept open for reuse once their thread hands them back
+_POOL_SIZE = 4
+
+# UUIDs are stored as their 16 raw bytes; columns declared UUID read back as UUID
+sqlite3.register_adapter(UUID, lambda value: value.bytes)
+sqlite3.register_converter("UUID", lambda value: UUID(bytes=value))
+
+# Dates are stored as ISO 8601 text. The stdlib's default adapters are
+# deprecated and its TIMESTAMP converter rejects the "T" separator.
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, datetime.isoformat)
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter(
+    "TIMESTAMP", lambda value: datetime.fromisoformat(value.decode())
+)
+
+# Tank equipment is stored as a JSON array in a column declared JSON. Writers
+# encode it explicitly; a list adapter would apply to every connection in
+# the process and hide lists passed as parameters by mistake.
+sqlite3.register_converter("JSON", orjson.loads)
+
+# Table definitions, keyed by table name
+_TABLES = {
+    "tanks": """(
+        id UUID PRIMARY KEY,
+        name TEXT NOT NULL,
+        size_gallons REAL NOT NULL,
+        tank_type TEXT NOT NULL,
+        location TEXT DEFAULT '',
+        equipment JSON DEFAULT '[]'
+    )""",
+    # Water parameters (for current tank parameters)
+    "water_parameters": """(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        tank_id UUID,
+        date_tested TIMESTAMP NOT NULL,
+        temperature REAL,
+        ph REAL,
+        ammonia REAL,
+        nitrite REAL,
+        nitrate REAL,
+        salinity REAL,
+        FOREIGN KEY (tank_id) REFERENCES tanks(id)
+    )""",
+    "fish": """(
+        id UUID PRIMARY KEY,
+        name TEXT NOT NULL,
+        species TEXT NOT NULL,
+        tank_id UUID NOT NULL,
+        date_added DATE NOT NULL,
+        birth_date DATE,
+        health_status TEXT DEFAULT 'healthy',
+        size TEXT,
+        color TEXT,
+        feeding_preferences TEXT,
+        notes TEXT,
+        FOREIGN KEY (tank_id) REFERENCES tanks(id)
+    )""",
+    "maintenance_logs": """(
+        id UUID PRIMARY KEY,
+        tank_id UUID NOT NULL,
+        date TIMESTAMP NOT NULL,
+        activity_type TEXT NOT NULL,
+        description TEXT NOT NULL,
+        water_params_id INTEGER,
+        FOREIGN KEY (tank_id) REFERENCES tanks(id),
+        FOREIGN KEY (water_params_id) REFERENCES water_parameters(id)
+    )""",
+}
+
+# Indexes for per-tank lookups
+_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_fish_tank ON fish(tank_id)",
+    """CREATE INDEX IF NOT EXISTS idx_maint_tank_date
+       ON maintenance_logs(tank_id, date DESC)""",
+    """CREATE INDEX IF NOT EXISTS idx_maint_type_tank_date
+       ON maintenance_logs(activity_type, tank_id, date DESC)""",
+    """CREATE INDEX IF NOT EXISTS idx_water_params_tank_date
+       ON water_parameters(tank_id, date_tested DESC)""",
+)
+
+
+def _uuid_blob(value: Optional[str]) -> Optional[bytes]:
+    """Convert a legacy text UUID to its 16-byte form."""
+    return UUID(value).bytes if isinstance(value, str) else value
+
+
+def _equipment_json(value: Optional[str]) -> str:
+    """Convert legacy comma-joined equipment to a JSON array."""
+    return orjson.dumps(value.split(",") if value else []).decode()
 
 
 class DataManager:
@@ -16,7 +116,19 @@ class DataManager:
         """
         self.db_path = Path(db_path)
         self._ensure_data_dir()
-        self._connection: Optional[sqlite3.Connection] = None
+        # Each thread uses its own connection. The server runs every request
+        # on a fresh thread, so connections are pooled and handed back with
+        # release() rather than opened and abandoned once per request.
+        self._local = threading.local()
+        self._idle: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        # Never writes; its PRAGMA data_version moves when any other
+        # connection commits, including ones in other processes.
+        self._watch: Optional[sqlite3.Connection] = None
+        self._watch_lock = threading.Lock()
+        # Bumped after every commit or rollback; lets read caches tell
+        # whether the database may have changed since they were filled.
+        self.generation = 0
         self._init_database()
 
     def _ensure_data_dir(self) -> None:
@@ -25,77 +137,132 @@ class DataManager:
 
     @property
     def connection(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._connection is None:
-            self._connection = sqlite3.connect(str(self.db_path))
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
+        """Get the database connection for the current thread.
 
-    def _init_database(self) -> None:
-        """Initialize database tables."""
-        cursor = self.connection.cursor()
+        Reuses an idle pooled connection when there is one.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            with self._pool_lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                connection = self._connect()
+            self._local.connection = connection
+        return connection
 
-        # Tanks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tanks (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                size_gallons REAL NOT NULL,
-                tank_type TEXT NOT NULL,
-                location TEXT DEFAULT '',
-                equipment TEXT DEFAULT ''
-            )
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new database connection."""
+        # Pooled connections move between threads, one thread at a time.
+        # The statement cache holds every query in services.managers, and it
+        # only pays off because pooled connections outlive a single request.
+        connection = sqlite3.connect(
+            str(self.db_path),
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            cached_statements=256,
+            check_same_thread=False,
+        )
+        connection.row_factory = sqlite3.Row
+        # WAL lets readers run alongside a writer; NORMAL sync skips the
+        # per-commit fsync that WAL makes unnecessary for durability. The
+        # page cache is per connection and outlives requests now that
+        # connections are pooled, so it is sized with the pool in mind;
+        # the memory map is shared through the OS page cache.
+        connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA mmap_size = 268435456;
+            PRAGMA cache_size = -16384;
         """)
+        return connection
 
-        # Water parameters table (for current tank parameters)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS water_parameters (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                tank_id TEXT,
-                date_tested TEXT NOT NULL,
-                temperature REAL,
-                ph REAL,
-                ammonia REAL,
-                nitrite REAL,
-                nitrate REAL,
-                salinity REAL,
-                FOREIGN KEY (tank_id) REFERENCES tanks(id)
-            )
-        """)
+    def release(self) -> None:
+        """Hand the current thread's connection back to the pool.
 
-        # Fish table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS fish (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                species TEXT NOT NULL,
-                tank_id TEXT NOT NULL,
-                date_added TEXT NOT NULL,
-                birth_date TEXT,
-                health_status TEXT DEFAULT 'healthy',
-                size TEXT,
-                color TEXT,
-                feeding_preferences TEXT,
-                notes TEXT,
-                FOREIGN KEY (tank_id) REFERENCES tanks(id)
-            )
-        """)
+        Does nothing inside ``transaction()``. A transaction left open
+        outside one is rolled back so the next user starts clean.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None or getattr(self._local, "depth", 0):
+            return
+        self._local.connection = None
+        if connection.in_transaction:
+            connection.rollback()
+        with self._pool_lock:
+            if len(self._idle) < _POOL_SIZE:
+                self._idle.append(connection)
+                return
+        connection.close()
 
-        # Maintenance logs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS maintenance_logs (
-                id TEXT PRIMARY KEY,
-                tank_id TEXT NOT NULL,
-                date TEXT NOT NULL,
-                activity_type TEXT NOT NULL,
-                description TEXT NOT NULL,
-                water_params_id INTEGER,
-                FOREIGN KEY (tank_id) REFERENCES tanks(id),
-                FOREIGN KEY (water_params_id) REFERENCES water_parameters(id)
-            )
-        """)
+    def _init_database(self) -> None:
+        """Initialize database tables, migrating older schemas in place."""
+        connection = self.connection
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        existing = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tanks'"
+        ).fetchone()
+        if existing and version < SCHEMA_VERSION:
+            self._migrate(version)
 
-        self.connection.commit()
+        cursor = connection.cursor()
+        for name, columns in _TABLES.items():
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {name} {columns}")
+        for index in _INDEXES:
+            cursor.execute(index)
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        connection.commit()
+        self.release()
+
+    def _migrate(self, version: int) -> None:
+        """Upgrade a database created with an older schema version."""
+        connection = self.connection
+        connection.create_function("uuid_blob", 1, _uuid_blob, deterministic=True)
+        connection.create_function(
+            "equipment_json", 1, _equipment_json, deterministic=True
+        )
+        connection.execute("BEGIN")
+        try:
+            if version < 2:
+                # Version 0 stored UUIDs as 36-char TEXT, and versions before 2
+                # declared date columns as TEXT so their converters never ran
+                uuid_columns = {
+                    "tanks": ("id",),
+                    "water_parameters": ("tank_id",),
+                    "fish": ("id", "tank_id"),
+                    "maintenance_logs": ("id", "tank_id"),
+                }
+                for name, columns in uuid_columns.items():
+                    converters = dict.fromkeys(columns, "uuid_blob") if version < 1 else {}
+                    self._rebuild_table(name, converters)
+            if version < 3:
+                # Equipment was stored comma-joined, which broke on names with commas
+                self._rebuild_table("tanks", {"equipment": "equipment_json"})
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+
+    def _rebuild_table(self, name: str, converters: dict[str, str]) -> None:
+        """Recreate a table with its current definition, keeping its rows.
+
+        SQLite can't change a column's declared type in place, so the rows are
+        copied into a fresh table, passing the columns named in ``converters``
+        through the given SQL function. Indexes are dropped along with the old
+        table and recreated afterwards.
+        """
+        cursor = self.connection.cursor()
+        columns = [row["name"] for row in cursor.execute(f"PRAGMA table_info({name})")]
+        select = ", ".join(
+            f"{converters[column]}({column})" if column in converters else column
+            for column in columns
+        )
+        cursor.execute(f"CREATE TABLE {name}_new {_TABLES[name]}")
+        cursor.execute(
+            f"INSERT INTO {name}_new ({', '.join(columns)}) SELECT {select} FROM {name}"
+        )
+        cursor.execute(f"DROP TABLE {name}")
+        cursor.execute(f"ALTER TABLE {name}_new RENAME TO {name}")
 
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """Execute a query and return the cursor."""
@@ -103,12 +270,105 @@ class DataManager:
         cursor.execute(query, params)
         return cursor
 
+    def executemany(self, query: str, seq_of_params: Iterable[tuple]) -> sqlite3.Cursor:
+        """Execute a query once per parameter tuple and return the cursor."""
+        cursor = self.connection.cursor()
+        cursor.executemany(query, seq_of_params)
+        return cursor
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group statements into one transaction.
+
+        Commits when the outermost block exits normally and rolls back on
+        error. Blocks may nest; ``commit()`` calls inside one are deferred so
+        the whole group is written with a single commit.
+        """
+        connection = self.connection
+        depth = getattr(self._local, "depth", 0)
+        if not depth:
+            # Take the write lock up front rather than on the first write
+            connection.execute("BEGIN IMMEDIATE")
+        self._local.depth = depth + 1
+        try:
+            yield connection
+        except BaseException:
+            self._local.depth = depth
+            if not depth:
+                connection.rollback()
+                self.generation += 1
+            raise
+        self._local.depth = depth
+        if not depth:
+            connection.commit()
+            self.generation += 1
+
     def commit(self) -> None:
-        """Commit the current transaction."""
-        self.connection.commit()
+        """Commit the current transaction, unless inside ``transaction()``."""
+        if not getattr(self._local, "depth", 0):
+            self.connection.commit()
+            self.generation += 1
+
+    def state(self) -> tuple[int, int]:
+        """Get a token that changes whenever committed data may have changed.
+
+        ``generation`` only counts this process's commits, so it is paired
+        with SQLite's data_version to catch writes from other processes,
+        such as the console UI sharing the database with the API server.
+        Long-lived read caches should be keyed on this.
+        """
+        with self._watch_lock:
+            if self._watch is None:
+                self._watch = sqlite3.connect(
+                    str(self.db_path), check_same_thread=False
+                )
+            cursor = self._watch.execute("PRAGMA data_version")
+            data_version = cursor.fetchone()[0]
+        return self.generation, data_version
+
+    @contextmanager
+    def snapshot(self) -> Iterator[None]:
+        """Reuse repeated reads for the duration of the block.
+
+        While active, results loaded through ``memoize()`` on this thread are
+        kept and handed back to later callers until the next commit.
+        """
+        if getattr(self._local, "memo", None) is not None:
+            yield  # Already inside a snapshot
+            return
+        self._local.memo = {}
+        try:
+            yield
+        finally:
+            self._local.memo = None
+
+    def memoize(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Return ``load()``, reusing an earlier result inside ``snapshot()``."""
+        memo = getattr(self._local, "memo", None)
+        if memo is None:
+            return load()
+        entry = memo.get(key)
+        if entry is not None and entry[0] == self.generation:
+            return entry[1]
+        generation = self.generation
+        value = load()
+        memo[key] = (generation, value)
+        return value
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the current thread's connection and every idle one."""
+        connection = getattr(self._local, "connection", None)
+        if connection:
+            connection.close()
+            self._local.connection = None
+        with self._pool_lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+        with self._watch_lock:
+            if self._watch is not None:
+                # A new watch connection restarts data_version, so move the
+                # generation on to keep old state() tokens from matching
+                self._watch.close()
+                self._watch = None
+                self.generation += 1
@@ -1,51 +1,217 @@
 """Business logic managers for tanks, fish, and maintenance."""
 
-from datetime import datetime, date
-from typing import Optional
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import Any, Callable, Hashable, Iterator, Optional
 from uuid import UUID
 
+import orjson
+
 from models import Fish, MaintenanceLog, Tank, WaterParameters
 from services.data_manager import DataManager
 
-
-class TankManager:
-    """Manages tank operations and persistence."""
+# Explicit column lists keep column order fixed, so the _row_to_* helpers
+# can unpack rows positionally instead of looking each column up by name.
+_TANK_COLUMNS = "id, name, size_gallons, tank_type, location, equipment"
+_FISH_COLUMNS = """id, name, species, tank_id, date_added, birth_date,
+    health_status, size, color, feeding_preferences, notes"""
+_WATER_PARAM_COLUMNS = "date_tested, temperature, ph, ammonia, nitrite, nitrate, salinity"
+
+# SQL statements are built once at import. Reusing the same string objects
+# lets sqlite3's statement cache hit without re-hashing freshly formatted SQL.
+_SELECT_TANKS = f"SELECT {_TANK_COLUMNS} FROM tanks"
+_SELECT_TANK = f"{_SELECT_TANKS} WHERE id = ?"
+_SELECT_TANK_NAMES = "SELECT id, name FROM tanks"
+_INSERT_TANK = """INSERT INTO tanks (id, name, size_gallons, tank_type, location, equipment)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+_UPDATE_TANK = """UPDATE tanks SET name = ?, size_gallons = ?, tank_type = ?,
+    location = ?, equipment = ? WHERE id = ?"""
+_DELETE_TANK = "DELETE FROM tanks WHERE id = ?"
+
+_INSERT_WATER_PARAMS = """INSERT INTO water_parameters
+    (tank_id, date_tested, temperature, ph, ammonia, nitrite, nitrate, salinity)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+_SELECT_LATEST_WATER_PARAMS = f"""SELECT {_WATER_PARAM_COLUMNS} FROM water_parameters
+    WHERE tank_id = ? ORDER BY date_tested DESC LIMIT 1"""
+_SELECT_WATER_PARAM_HISTORY = """SELECT wp.date_tested, wp.temperature, wp.ph,
+        wp.ammonia, wp.nitrite, wp.nitrate, wp.salinity
+    FROM water_parameters wp
+    JOIN maintenance_logs ml ON wp.id = ml.water_params_id
+    WHERE ml.tank_id = ? AND ml.activity_type = 'water_test'
+    ORDER BY wp.date_tested DESC LIMIT ?"""
+_DELETE_WATER_PARAMS_BY_TANK = """DELETE FROM water_parameters WHERE id IN
+    (SELECT water_params_id FROM maintenance_logs WHERE tank_id = ?)"""
+
+_SELECT_FISH = f"SELECT {_FISH_COLUMNS} FROM fish"
+_SELECT_FISH_BY_ID = f"{_SELECT_FISH} WHERE id = ?"
+_SELECT_FISH_BY_TANK = f"{_SELECT_FISH} WHERE tank_id = ?"
+_INSERT_FISH = f"""INSERT INTO fish ({_FISH_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_UPDATE_FISH = """UPDATE fish SET name = ?, species = ?, tank_id = ?, date_added = ?,
+    birth_date = ?, health_status = ?, size = ?, color = ?,
+    feeding_preferences = ?, notes = ? WHERE id = ?"""
+_MOVE_FISH = "UPDATE fish SET tank_id = ? WHERE id = ?"
+_UPDATE_FISH_HEALTH = "UPDATE fish SET health_status = ? WHERE id = ?"
+_DELETE_FISH = "DELETE FROM fish WHERE id = ?"
+_DELETE_FISH_BY_TANK = "DELETE FROM fish WHERE tank_id = ?"
+_COUNT_FISH_BY_TANK = "SELECT COUNT(*) FROM fish WHERE tank_id = ?"
+_COUNT_FISH_HEALTH_BY_TANK = """SELECT tank_id, health_status, COUNT(*) AS count
+    FROM fish GROUP BY tank_id, health_status"""
+
+# Maintenance logs joined with their water parameters, so listing logs
+# takes one query instead of one extra lookup per water test.
+_SELECT_LOGS = """
+    SELECT ml.id, ml.tank_id, ml.date, ml.activity_type, ml.description,
+           wp.date_tested, wp.temperature, wp.ph, wp.ammonia,
+           wp.nitrite, wp.nitrate, wp.salinity
+    FROM maintenance_logs ml
+    LEFT JOIN water_parameters wp ON wp.id = ml.water_params_id"""
+_SELECT_ALL_LOGS = f"{_SELECT_LOGS} ORDER BY ml.date DESC"
+_SELECT_LOGS_BY_TANK = f"{_SELECT_LOGS} WHERE ml.tank_id = ? ORDER BY ml.date DESC"
+_SELECT_RECENT_LOGS_BY_TANK = f"{_SELECT_LOGS_BY_TANK} LIMIT ?"
+_SELECT_RECENT_LOGS = f"{_SELECT_LOGS} ORDER BY ml.date DESC LIMIT ?"
+_SELECT_LOGS_BY_TYPE = f"{_SELECT_LOGS} WHERE ml.activity_type = ? ORDER BY ml.date DESC"
+_SELECT_LOGS_BY_TYPE_AND_TANK = f"""{_SELECT_LOGS}
+    WHERE ml.activity_type = ? AND ml.tank_id = ? ORDER BY ml.date DESC"""
+_INSERT_LOG = """INSERT INTO maintenance_logs
+    (id, tank_id, date, activity_type, description, water_params_id)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+_DELETE_LOGS_BY_TANK = "DELETE FROM maintenance_logs WHERE tank_id = ?"
+_COUNT_LOGS_BY_TANK = "SELECT COUNT(*) FROM maintenance_logs WHERE tank_id = ?"
+_COUNT_LOGS_BY_TYPE = """SELECT activity_type, COUNT(*) AS count
+    FROM maintenance_logs WHERE tank_id = ? GROUP BY activity_type"""
+_LOG_STATS_BY_TANK = """SELECT tank_id, COUNT(*) AS count,
+    MAX(date) AS "last_date [TIMESTAMP]" FROM maintenance_logs GROUP BY tank_id"""
+
+
+def _row_to_params(row) -> WaterParameters:
+    """Convert a row of _WATER_PARAM_COLUMNS to a WaterParameters object."""
+    date_tested, temperature, ph, ammonia, nitrite, nitrate, salinity = row
+    return WaterParameters(
+        date_tested=date_tested,
+        temperature=temperature,
+        ph=ph,
+        ammonia=ammonia,
+        nitrite=nitrite,
+        nitrate=nitrate,
+        salinity=salinity,
+    )
+
+
+class _LRUCache:
+    """Bounded least-recently-used cache of objects loaded from the database.
+
+    Entries are tagged with the DataManager state they were loaded under,
+    so any commit, from this process or another, makes every earlier entry
+    a miss.
+    """
+
+    def __init__(self, data_manager: DataManager, maxsize: int = 128):
+        self._db = data_manager
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[tuple[int, int], Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != self._db.state():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, state: tuple[int, int]) -> None:
+        """Cache a value loaded while the database was at ``state``."""
+        with self._lock:
+            self._entries[key] = (state, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+class BaseManager:
+    """Shared read caching for managers persisting through a DataManager."""
 
     def __init__(self, data_manager: DataManager):
         self.db = data_manager
+        self._cache = _LRUCache(data_manager)
+
+    def _cached(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Return ``load()``, cached until the database next changes.
+
+        Cached results are shared between callers and must not be modified.
+        Nothing is cached when ``load()`` returns None.
+        """
+        value = self._cache.get(key)
+        if value is None:
+            state = self.db.state()
+            value = load()
+            if value is not None:
+                self._cache.put(key, value, state)
+        return value
+
+
+class TankManager(BaseManager):
+    """Manages tank operations and persistence."""
 
     def get_all(self) -> list[Tank]:
         """Get all tanks."""
-        cursor = self.db.execute("SELECT * FROM tanks")
+        return self.db.memoize("tanks", self._load_all)
+
+    def names_by_id(self) -> dict[UUID, str]:
+        """Get every tank's name by ID, without loading water parameters.
+
+        Cached until the next write; the result must not be modified.
+        """
+        return self._cached(
+            "names",
+            lambda: dict(self.db.execute(_SELECT_TANK_NAMES)),
+        )
+
+    def _load_all(self) -> list[Tank]:
+        """Load all tanks with their latest water parameters."""
+        cursor = self.db.execute(_SELECT_TANKS)
         tanks = []
-        for row in cursor.fetchall():
-            tank = self._row_to_tank(row)
+        for tank in map(self._row_to_tank, cursor):
             tank.current_parameters = self._get_latest_params(tank.id)
             tanks.append(tank)
         return tanks
 
     def get_by_id(self, tank_id: UUID) -> Optional[Tank]:
-        """Get a tank by ID."""
-        cursor = self.db.execute("SELECT * FROM tanks WHERE id = ?", (str(tank_id),))
-        row = cursor.fetchone()
-        if row:
-            tank = self._row_to_tank(row)
-            tank.current_parameters = self._get_latest_params(tank.id)
-            return tank
-        return None
+        """Get a tank by ID.
+
+        Results are cached until the next write, so the returned tank is
+        shared and must not be modified in place.
+        """
+        return self._cached(tank_id, lambda: self._load_by_id(tank_id))
+
+    def _load_by_id(self, tank_id: UUID) -> Optional[Tank]:
+        """Load a tank with its latest water parameters."""
+        row = self.db.execute(_SELECT_TANK, (tank_id,)).fetchone()
+        if row is None:
+            return None
+        tank = self._row_to_tank(row)
+        tank.current_parameters = self._get_latest_params(tank.id)
+        return tank
 
     def add(self, tank: Tank) -> None:
         """Add a new tank."""
         self.db.execute(
-            """INSERT INTO tanks (id, name, size_gallons, tank_type, location, equipment)
-               VALUES (?, ?, ?, ?, ?, ?)""",
+            _INSERT_TANK,
             (
-                str(tank.id),
+                tank.id,
                 tank.name,
                 tank.size_gallons,
                 tank.tank_type,
                 tank.location,
-                ",".join(tank.equipment),
+                orjson.dumps(tank.equipment).decode(),
             ),
         )
         self.db.commit()
@@ -53,15 +219,14 @@ class TankManager:
     def update(self, tank: Tank) -> bool:
         """Update an existing tank."""
         cursor = self.db.execute(
-            """UPDATE tanks SET name = ?, size_gallons = ?, tank_type = ?,
-               location = ?, equipment = ? WHERE id = ?""",
+            _UPDATE_TANK,
             (
                 tank.name,
                 tank.size_gallons,
                 tank.tank_type,
                 tank.location,
-                ",".join(tank.equipment),
-                str(tank.id),
+                orjson.dumps(tank.equipment).decode(),
+                tank.id,
             ),
         )
         self.db.commit()
@@ -69,19 +234,17 @@ class TankManager:
 
     def delete(self, tank_id: UUID) -> bool:
         """Delete a tank by ID."""
-        cursor = self.db.execute("DELETE FROM tanks WHERE id = ?", (str(tank_id),))
+        cursor = self.db.execute(_DELETE_TANK, (tank_id,))
         self.db.commit()
         return cursor.rowcount > 0
 
     def update_water_params(self, tank_id: UUID, params: WaterParameters) -> bool:
         """Update current water parameters for a tank."""
         self.db.execute(
-            """INSERT INTO water_parameters
-               (tank_id, date_tested, temperature, ph, ammonia, nitrite, nitrate, salinity)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            _INSERT_WATER_PARAMS,
             (
-                str(tank_id),
-                params.date_tested.isoformat(),
+                tank_id,
+                params.date_tested,
                 params.temperature,
                 params.ph,
                 params.ammonia,
@@ -95,101 +258,88 @@ class TankManager:
 
     def _get_latest_params(self, tank_id: UUID) -> Optional[WaterParameters]:
         """Get the most recent water parameters for a tank."""
-        cursor = self.db.execute(
-            """SELECT * FROM water_parameters WHERE tank_id = ?
-               ORDER BY date_tested DESC LIMIT 1""",
-            (str(tank_id),),
-        )
+        cursor = self.db.execute(_SELECT_LATEST_WATER_PARAMS, (tank_id,))
         row = cursor.fetchone()
-        if row:
-            return WaterParameters(
-                date_tested=datetime.fromisoformat(row["date_tested"]),
-                temperature=row["temperature"],
-                ph=row["ph"],
-                ammonia=row["ammonia"],
-                nitrite=row["nitrite"],
-                nitrate=row["nitrate"],
-                salinity=row["salinity"],
-            )
-        return None
+        return _row_to_params(row) if row else None
 
     def _row_to_tank(self, row) -> Tank:
         """Convert a database row to a Tank object."""
-        equipment = row["equipment"].split(",") if row["equipment"] else []
+        id_, name, size_gallons, tank_type, location, equipment = row
         return Tank(
-            id=UUID(row["id"]),
-            name=row["name"],
-            size_gallons=row["size_gallons"],
-            tank_type=row["tank_type"],
-            location=row["location"] or "",
+            id=id_,
+            name=name,
+            size_gallons=size_gallons,
+            tank_type=tank_type,
+            location=location or "",
             equipment=equipment,
         )
 
 
-class FishManager:
+class FishManager(BaseManager):
     """Manages fish operations and persistence."""
 
-    def __init__(self, data_manager: DataManager):
-        self.db = data_manager
-
     def get_all(self) -> list[Fish]:
         """Get all fish."""
-        cursor = self.db.execute("SELECT * FROM fish")
-        return [self._row_to_fish(row) for row in cursor.fetchall()]
+        return self.db.memoize("fish", self._load_all)
+
+    def _load_all(self) -> list[Fish]:
+        """Load all fish."""
+        cursor = self.db.execute(_SELECT_FISH)
+        return list(map(self._row_to_fish, cursor))
 
     def get_by_id(self, fish_id: UUID) -> Optional[Fish]:
-        """Get a fish by ID."""
-        cursor = self.db.execute("SELECT * FROM fish WHERE id = ?", (str(fish_id),))
-        row = cursor.fetchone()
+        """Get a fish by ID.
+
+        Results are cached until the next write, so the returned fish is
+        shared and must not be modified in place.
+        """
+        return self._cached(fish_id, lambda: self._load_by_id(fish_id))
+
+    def _load_by_id(self, fish_id: UUID) -> Optional[Fish]:
+        """Load a fish."""
+        row = self.db.execute(_SELECT_FISH_BY_ID, (fish_id,)).fetchone()
         return self._row_to_fish(row) if row else None
 
     def get_by_tank(self, tank_id: UUID) -> list[Fish]:
         """Get all fish in a specific tank."""
-        cursor = self.db.execute(
-            "SELECT * FROM fish WHERE tank_id = ?", (str(tank_id),)
-        )
-        return [self._row_to_fish(row) for row in cursor.fetchall()]
+        cursor = self.db.execute(_SELECT_FISH_BY_TANK, (tank_id,))
+        return list(map(self._row_to_fish, cursor))
+
+    def group_by_tank(self) -> dict[UUID, list[Fish]]:
+        """Get all fish grouped by tank ID, from a single query."""
+        groups: dict[UUID, list[Fish]] = defaultdict(list)
+        for fish in self.get_all():
+            groups[fish.tank_id].append(fish)
+        return groups
 
     def add(self, fish: Fish) -> None:
         """Add a new fish."""
-        self.db.execute(
-            """INSERT INTO fish (id, name, species, tank_id, date_added, birth_date,
-               health_status, size, color, feeding_preferences, notes)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                str(fish.id),
-                fish.name,
-                fish.species,
-                str(fish.tank_id),
-                fish.date_added.isoformat(),
-                fish.birth_date.isoformat() if fish.birth_date else None,
-                fish.health_status,
-                fish.size,
-                fish.color,
-                fish.feeding_preferences,
-                fish.notes,
-            ),
-        )
-        self.db.commit()
+        self.add_many([fish])
+
+    def add_many(self, fish_list: list[Fish]) -> None:
+        """Add several fish in a single transaction."""
+        with self.db.transaction():
+            self.db.executemany(
+                _INSERT_FISH,
+                [self._fish_to_row(fish) for fish in fish_list],
+            )
 
     def update(self, fish: Fish) -> bool:
         """Update an existing fish."""
         cursor = self.db.execute(
-            """UPDATE fish SET name = ?, species = ?, tank_id = ?, date_added = ?,
-               birth_date = ?, health_status = ?, size = ?, color = ?,
-               feeding_preferences = ?, notes = ? WHERE id = ?""",
+            _UPDATE_FISH,
             (
                 fish.name,
                 fish.species,
-                str(fish.tank_id),
-                fish.date_added.isoformat(),
-                fish.birth_date.isoformat() if fish.birth_date else None,
+                fish.tank_id,
+                fish.date_added,
+                fish.birth_date,
                 fish.health_status,
                 fish.size,
                 fish.color,
                 fish.feeding_preferences,
                 fish.notes,
-                str(fish.id),
+                fish.id,
             ),
         )
         self.db.commit()
@@ -197,135 +347,189 @@ class FishManager:
 
     def move_to_tank(self, fish_id: UUID, new_tank_id: UUID) -> bool:
         """Move a fish to a different tank."""
-        cursor = self.db.execute(
-            "UPDATE fish SET tank_id = ? WHERE id = ?",
-            (str(new_tank_id), str(fish_id)),
-        )
+        cursor = self.db.execute(_MOVE_FISH, (new_tank_id, fish_id))
         self.db.commit()
         return cursor.rowcount > 0
 
     def update_health_status(self, fish_id: UUID, status: str) -> bool:
         """Update a fish's health status."""
-        if status not in Fish.VALID_HEALTH_STATUSES:
+        if status not in Fish.HEALTH_STATUS_SET:
             return False
-        cursor = self.db.execute(
-            "UPDATE fish SET health_status = ? WHERE id = ?",
-            (status, str(fish_id)),
-        )
+        cursor = self.db.execute(_UPDATE_FISH_HEALTH, (status, fish_id))
         self.db.commit()
         return cursor.rowcount > 0
 
     def delete(self, fish_id: UUID) -> bool:
         """Delete a fish by ID."""
-        cursor = self.db.execute("DELETE FROM fish WHERE id = ?", (str(fish_id),))
+        cursor = self.db.execute(_DELETE_FISH, (fish_id,))
         self.db.commit()
         return cursor.rowcount > 0
 
     def delete_by_tank(self, tank_id: UUID) -> int:
         """Delete all fish in a tank. Returns count of deleted fish."""
-        cursor = self.db.execute(
-            "DELETE FROM fish WHERE tank_id = ?", (str(tank_id),)
-        )
+        cursor = self.db.execute(_DELETE_FISH_BY_TANK, (tank_id,))
         self.db.commit()
         return cursor.rowcount
 
+    def count_by_tank(self, tank_id: UUID) -> int:
+        """Get the number of fish in a tank."""
+        return self.db.execute(_COUNT_FISH_BY_TANK, (tank_id,)).fetchone()[0]
+
+    def health_counts_by_tank(self) -> dict[UUID, dict[str, int]]:
+        """Get fish counts per health status for every tank in one query.
+
+        Cached until the next write; the result must not be modified.
+        """
+        return self._cached("health_counts", self._load_health_counts)
+
+    def counts_by_tank(self) -> dict[UUID, int]:
+        """Get the number of fish in every tank."""
+        return self._cached(
+            "counts",
+            lambda: {
+                tank_id: sum(counts.values())
+                for tank_id, counts in self.health_counts_by_tank().items()
+            },
+        )
+
+    def _load_health_counts(self) -> dict[UUID, dict[str, int]]:
+        """Count fish per health status for every tank."""
+        cursor = self.db.execute(_COUNT_FISH_HEALTH_BY_TANK)
+        counts: dict[UUID, dict[str, int]] = {}
+        for row in cursor:
+            counts.setdefault(row["tank_id"], {})[row["health_status"]] = row["count"]
+        return counts
+
+    def _fish_to_row(self, fish: Fish) -> tuple:
+        """Convert a Fish object to insert parameters."""
+        return (
+            fish.id,
+            fish.name,
+            fish.species,
+            fish.tank_id,
+            fish.date_added,
+            fish.birth_date,
+            fish.health_status,
+            fish.size,
+            fish.color,
+            fish.feeding_preferences,
+            fish.notes,
+        )
+
     def _row_to_fish(self, row) -> Fish:
         """Convert a database row to a Fish object."""
+        (
+            id_, name, species, tank_id, date_added, birth_date,
+            health_status, size, color, feeding_preferences, notes,
+        ) = row
         return Fish(
-            id=UUID(row["id"]),
-            name=row["name"],
-            species=row["species"],
-            tank_id=UUID(row["tank_id"]),
-            date_added=date.fromisoformat(row["date_added"]),
-            birth_date=date.fromisoformat(row["birth_date"]) if row["birth_date"] else None,
-            health_status=row["health_status"],
-            size=row["size"],
-            color=row["color"],
-            feeding_preferences=row["feeding_preferences"],
-            notes=row["notes"],
+            id=id_,
+            name=name,
+            species=species,
+            tank_id=tank_id,
+            date_added=date_added,
+            birth_date=birth_date,
+            health_status=health_status,
+            size=size,
+            color=color,
+            feeding_preferences=feeding_preferences,
+            notes=notes,
         )
 
 
-class MaintenanceManager:
+class MaintenanceManager(BaseManager):
     """Manages maintenance log operations and persistence."""
 
-    def __init__(self, data_manager: DataManager):
-        self.db = data_manager
-
     def get_all(self) -> list[MaintenanceLog]:
         """Get all maintenance logs, sorted by date descending."""
-        cursor = self.db.execute(
-            "SELECT * FROM maintenance_logs ORDER BY date DESC"
-        )
-        return [self._row_to_log(row) for row in cursor.fetchall()]
+        return self.db.memoize("logs", lambda: list(self.iter_all()))
 
-    def get_by_tank(self, tank_id: UUID) -> list[MaintenanceLog]:
-        """Get all logs for a specific tank, sorted by date descending."""
-        cursor = self.db.execute(
-            "SELECT * FROM maintenance_logs WHERE tank_id = ? ORDER BY date DESC",
-            (str(tank_id),),
-        )
-        return [self._row_to_log(row) for row in cursor.fetchall()]
+    def iter_all(self) -> Iterator[MaintenanceLog]:
+        """Yield all maintenance logs, sorted by date descending."""
+        cursor = self.db.execute(_SELECT_ALL_LOGS)
+        yield from map(self._row_to_log, cursor)
+
+    def get_by_tank(
+        self, tank_id: UUID, limit: Optional[int] = None
+    ) -> list[MaintenanceLog]:
+        """Get logs for a specific tank, sorted by date descending.
+
+        Args:
+            tank_id: Tank to get logs for.
+            limit: Maximum number of logs to return, or None for all.
+        """
+        return list(self.iter_by_tank(tank_id, limit))
+
+    def iter_by_tank(
+        self, tank_id: UUID, limit: Optional[int] = None
+    ) -> Iterator[MaintenanceLog]:
+        """Yield logs for a specific tank, sorted by date descending."""
+        if limit is None:
+            cursor = self.db.execute(_SELECT_LOGS_BY_TANK, (tank_id,))
+        else:
+            cursor = self.db.execute(_SELECT_RECENT_LOGS_BY_TANK, (tank_id, limit))
+        yield from map(self._row_to_log, cursor)
 
     def get_recent(self, limit: int = 10) -> list[MaintenanceLog]:
         """Get most recent logs across all tanks."""
-        cursor = self.db.execute(
-            "SELECT * FROM maintenance_logs ORDER BY date DESC LIMIT ?", (limit,)
-        )
-        return [self._row_to_log(row) for row in cursor.fetchall()]
+        cursor = self.db.execute(_SELECT_RECENT_LOGS, (limit,))
+        return list(map(self._row_to_log, cursor))
 
     def get_by_activity_type(
         self, activity_type: str, tank_id: Optional[UUID] = None
     ) -> list[MaintenanceLog]:
         """Get logs by activity type, optionally filtered by tank."""
+        return list(self.iter_by_activity_type(activity_type, tank_id))
+
+    def iter_by_activity_type(
+        self, activity_type: str, tank_id: Optional[UUID] = None
+    ) -> Iterator[MaintenanceLog]:
+        """Yield logs by activity type, optionally filtered by tank."""
         if tank_id:
             cursor = self.db.execute(
-                """SELECT * FROM maintenance_logs
-                   WHERE activity_type = ? AND tank_id = ? ORDER BY date DESC""",
-                (activity_type, str(tank_id)),
+                _SELECT_LOGS_BY_TYPE_AND_TANK, (activity_type, tank_id)
             )
         else:
-            cursor = self.db.execute(
-                "SELECT * FROM maintenance_logs WHERE activity_type = ? ORDER BY date DESC",
-                (activity_type,),
-            )
-        return [self._row_to_log(row) for row in cursor.fetchall()]
+            cursor = self.db.execute(_SELECT_LOGS_BY_TYPE, (activity_type,))
+        yield from map(self._row_to_log, cursor)
 
     def add(self, log: MaintenanceLog) -> None:
         """Add a new maintenance log."""
-        water_params_id = None
-        if log.water_params:
-            cursor = self.db.execute(
-                """INSERT INTO water_parameters
-                   (tank_id, date_tested, temperature, ph, ammonia, nitrite, nitrate, salinity)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    str(log.tank_id),
-                    log.water_params.date_tested.isoformat(),
-                    log.water_params.temperature,
-                    log.water_params.ph,
-                    log.water_params.ammonia,
-                    log.water_params.nitrite,
-                    log.water_params.nitrate,
-                    log.water_params.salinity,
-                ),
-            )
-            water_params_id = cursor.lastrowid
-
-        self.db.execute(
-            """INSERT INTO maintenance_logs
-               (id, tank_id, date, activity_type, description, water_params_id)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (
-                str(log.id),
-                str(log.tank_id),
-                log.date.isoformat(),
-                log.activity_type,
-                log.description,
-                water_params_id,
-            ),
-        )
-        self.db.commit()
+        self.add_many([log])
+
+    def add_many(self, logs: list[MaintenanceLog]) -> None:
+        """Add several maintenance logs in a single transaction."""
+        with self.db.transaction():
+            rows = []
+            for log in logs:
+                water_params_id = None
+                if log.water_params:
+                    # Each log needs its parameters' row id, so these go one by one
+                    cursor = self.db.execute(
+                        _INSERT_WATER_PARAMS,
+                        (
+                            log.tank_id,
+                            log.water_params.date_tested,
+                            log.water_params.temperature,
+                            log.water_params.ph,
+                            log.water_params.ammonia,
+                            log.water_params.nitrite,
+                            log.water_params.nitrate,
+                            log.water_params.salinity,
+                        ),
+                    )
+                    water_params_id = cursor.lastrowid
+                rows.append(
+                    (
+                        log.id,
+                        log.tank_id,
+                        log.date,
+                        log.activity_type,
+                        log.description,
+                        water_params_id,
+                    )
+                )
+            self.db.executemany(_INSERT_LOG, rows)
 
     def log_water_change(
         self, tank_id: UUID, description: str, percentage: Optional[int] = None
@@ -396,69 +600,52 @@ class MaintenanceManager:
 
     def delete_by_tank(self, tank_id: UUID) -> int:
         """Delete all logs for a tank. Returns count of deleted logs."""
-        # First delete associated water parameters
-        self.db.execute(
-            """DELETE FROM water_parameters WHERE id IN
-               (SELECT water_params_id FROM maintenance_logs WHERE tank_id = ?)""",
-            (str(tank_id),),
-        )
-        cursor = self.db.execute(
-            "DELETE FROM maintenance_logs WHERE tank_id = ?", (str(tank_id),)
-        )
-        self.db.commit()
+        with self.db.transaction():
+            # First delete associated water parameters
+            self.db.execute(_DELETE_WATER_PARAMS_BY_TANK, (tank_id,))
+            cursor = self.db.execute(_DELETE_LOGS_BY_TANK, (tank_id,))
         return cursor.rowcount
 
+    def count_by_tank(self, tank_id: UUID) -> int:
+        """Get the number of logs for a tank."""
+        return self.db.execute(_COUNT_LOGS_BY_TANK, (tank_id,)).fetchone()[0]
+
+    def activity_counts(self, tank_id: UUID) -> dict[str, int]:
+        """Get the number of logs per activity type for a tank."""
+        cursor = self.db.execute(_COUNT_LOGS_BY_TYPE, (tank_id,))
+        return {row["activity_type"]: row["count"] for row in cursor}
+
+    def stats_by_tank(self) -> dict[UUID, tuple[int, datetime]]:
+        """Get log count and latest log date for every tank in one query.
+
+        Cached until the next write; the result must not be modified.
+        """
+        return self._cached("stats", self._load_stats)
+
+    def _load_stats(self) -> dict[UUID, tuple[int, datetime]]:
+        """Count logs and find the latest log date for every tank."""
+        cursor = self.db.execute(_LOG_STATS_BY_TANK)
+        return {
+            row["tank_id"]: (row["count"], row["last_date"])
+            for row in cursor
+        }
+
     def get_water_param_history(
         self, tank_id: UUID, limit: int = 10
     ) -> list[WaterParameters]:
         """Get water parameter history for a tank."""
-        cursor = self.db.execute(
-            """SELECT wp.* FROM water_parameters wp
-               JOIN maintenance_logs ml ON wp.id = ml.water_params_id
-               WHERE ml.tank_id = ? AND ml.activity_type = 'water_test'
-               ORDER BY wp.date_tested DESC LIMIT ?""",
-            (str(tank_id), limit),
-        )
-        params = []
-        for row in cursor.fetchall():
-            params.append(
-                WaterParameters(
-                    date_tested=datetime.fromisoformat(row["date_tested"]),
-                    temperature=row["temperature"],
-                    ph=row["ph"],
-                    ammonia=row["ammonia"],
-                    nitrite=row["nitrite"],
-                    nitrate=row["nitrate"],
-                    salinity=row["salinity"],
-                )
-            )
-        return params
+        cursor = self.db.execute(_SELECT_WATER_PARAM_HISTORY, (tank_id, limit))
+        return list(map(_row_to_params, cursor))
 
     def _row_to_log(self, row) -> MaintenanceLog:
-        """Convert a database row to a MaintenanceLog object."""
-        water_params = None
-        if row["water_params_id"]:
-            cursor = self.db.execute(
-                "SELECT * FROM water_parameters WHERE id = ?",
-                (row["water_params_id"],),
-            )
-            wp_row = cursor.fetchone()
-            if wp_row:
-                water_params = WaterParameters(
-                    date_tested=datetime.fromisoformat(wp_row["date_tested"]),
-                    temperature=wp_row["temperature"],
-                    ph=wp_row["ph"],
-                    ammonia=wp_row["ammonia"],
-                    nitrite=wp_row["nitrite"],
-                    nitrate=wp_row["nitrate"],
-                    salinity=wp_row["salinity"],
-                )
-
+        """Convert a joined log/water parameters row to a MaintenanceLog object."""
+        id_, tank_id, logged, activity_type, description = row[:5]
+        params = row[5:]
         return MaintenanceLog(
-            id=UUID(row["id"]),
-            tank_id=UUID(row["tank_id"]),
-            date=datetime.fromisoformat(row["date"]),
-            activity_type=row["activity_type"],
-            description=row["description"],
-            water_params=water_params,
+            id=id_,
+            tank_id=tank_id,
+            date=logged,
+            activity_type=activity_type,
+            description=description,
+            water_params=_row_to_params(params) if params[0] else None,
         )
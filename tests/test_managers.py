@@ -0,0 +1,61 @@
+"""Tests for the manager read caches."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from models import Fish, Tank
+from services import DataManager, FishManager, MaintenanceManager, TankManager
+
+
+class AggregateCacheTest(unittest.TestCase):
+    """Per-tank aggregates are reused until the next write."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = DataManager(str(Path(tmp.name) / "fishtank.db"))
+        self.addCleanup(self.db.close)
+        self.tanks = TankManager(self.db)
+        self.fish = FishManager(self.db)
+        self.maintenance = MaintenanceManager(self.db)
+
+        self.tank = Tank(name="Reef", size_gallons=40, tank_type="saltwater")
+        self.tanks.add(self.tank)
+        self.fish.add(Fish(name="Nemo", species="Clownfish", tank_id=self.tank.id))
+        self.maintenance.log_feeding(self.tank.id, "Flakes")
+
+        self.statements: list[str] = []
+        self.db.connection.set_trace_callback(self.statements.append)
+
+    def _aggregate_queries(self) -> int:
+        """Count aggregate statements run since tracing started."""
+        return sum("GROUP BY tank_id" in sql for sql in self.statements)
+
+    def _view_report(self):
+        """Read the aggregates the way the console summary screen does."""
+        return (
+            self.fish.health_counts_by_tank(),
+            self.fish.counts_by_tank(),
+            self.maintenance.stats_by_tank(),
+        )
+
+    def test_repeated_views_query_once(self):
+        first = self._view_report()
+        second = self._view_report()
+
+        self.assertEqual(first, second)
+        self.assertEqual(self._aggregate_queries(), 2)
+
+    def test_write_invalidates(self):
+        self._view_report()
+        self.fish.add(Fish(name="Dory", species="Blue Tang", tank_id=self.tank.id))
+        health_counts, counts, _ = self._view_report()
+
+        self.assertEqual(counts[self.tank.id], 2)
+        self.assertEqual(health_counts[self.tank.id], {"healthy": 2})
+        self.assertEqual(self._aggregate_queries(), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,136 @@
 """Console UI for pyFishTank."""
 
-from datetime import date, datetime
+import functools
+import re
+import sys
+from datetime import date
 from typing import Optional
-from uuid import UUID
 
 from models import Fish, Tank, WaterParameters
 from services import DataManager, FishManager, MaintenanceManager, TankManager
 
+try:
+    # Gives input() line editing and history on interactive terminals
+    import readline  # noqa: F401
+except ImportError:  # Not available on Windows
+    pass
+
+# Plural activity names for the maintenance history breakdown
+_ACTIVITY_DISPLAY_NAMES = {
+    "water_change": "Water Changes",
+    "filter_clean": "Filter Cleanings",
+    "feeding": "Feedings",
+    "water_test": "Water Tests",
+    "equipment_check": "Equipment Checks",
+    "medication": "Medications",
+}
+
+# Selection lists longer than this offer a name filter before listing
+_FILTER_THRESHOLD = 20
+
+# Water test prompts, in the order they are asked; saltwater tanks add salinity
+_WATER_TEST_PROMPTS = (
+    ("temperature", "Temperature (F): "),
+    ("ph", "pH: "),
+    ("ammonia", "Ammonia (ppm): "),
+    ("nitrite", "Nitrite (ppm): "),
+    ("nitrate", "Nitrate (ppm): "),
+)
+
+# Water parameters averaged in the trends report, with their display lines
+_AVERAGE_FORMATS = {
+    "temperature": "  Temperature: {:.1f}F",
+    "ph": "  pH: {:.2f}",
+    "ammonia": "  Ammonia: {:.2f} ppm",
+    "nitrite": "  Nitrite: {:.2f} ppm",
+    "nitrate": "  Nitrate: {:.1f} ppm",
+}
+
+# Menu screens, each written in one call
+_MAIN_MENU = "\n".join((
+    "\n" + "=" * 30,
+    "      === pyFishTank ===",
+    "=" * 30,
+    "1. Tank Management",
+    "2. Fish Management",
+    "3. Maintenance Logs",
+    "4. Reports",
+    "0. Exit",
+)) + "\n"
+
+_TANK_MENU = "\n".join((
+    "\n--- Tank Management ---",
+    "1. View All Tanks",
+    "2. Add Tank",
+    "3. Edit Tank",
+    "4. Delete Tank",
+    "5. View Tank Details",
+    "0. Back",
+)) + "\n"
+
+_FISH_MENU = "\n".join((
+    "\n--- Fish Management ---",
+    "1. View All Fish",
+    "2. Add Fish",
+    "3. Edit Fish",
+    "4. Move Fish",
+    "5. Update Health Status",
+    "6. Remove Fish",
+    "0. Back",
+)) + "\n"
+
+_MAINTENANCE_MENU = "\n".join((
+    "\n--- Maintenance Logs ---",
+    "1. View Recent Logs",
+    "2. Log Water Change",
+    "3. Log Feeding",
+    "4. Log Water Test",
+    "5. Log Filter Cleaning",
+    "6. Log Equipment Check",
+    "7. Log Medication",
+    "0. Back",
+)) + "\n"
+
+_REPORTS_MENU = "\n".join((
+    "\n--- Reports ---",
+    "1. Tank Summary",
+    "2. Maintenance History",
+    "3. Water Parameter Trends",
+    "0. Back",
+)) + "\n"
+
+# Plain decimal numbers; anything else typed at a numeric prompt is invalid
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+
+
+def _parse_int(text: str) -> Optional[int]:
+    """Parse a whole number typed at a prompt, or return None if invalid."""
+    text = text.strip()
+    return int(text) if _INT_RE.fullmatch(text) else None
+
+
+def _parse_float(text: str) -> Optional[float]:
+    """Parse a decimal number typed at a prompt, or return None if invalid."""
+    text = text.strip()
+    return float(text) if _FLOAT_RE.fullmatch(text) else None
+
+
+def _split_csv(text: str) -> list[str]:
+    """Split comma-separated input into stripped, non-empty items."""
+    return [item for item in map(str.strip, text.split(",")) if item]
+
+
+def _snapshot(method):
+    """Run a console action with repeated reads served from one snapshot."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.data_manager.snapshot():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class ConsoleUI:
     """Console-based user interface for pyFishTank."""
@@ -42,28 +166,29 @@ class ConsoleUI:
 
     def _show_main_menu(self) -> str:
         """Display main menu and get user choice."""
-        print("\n" + "=" * 30)
-        print("      === pyFishTank ===")
-        print("=" * 30)
-        print("1. Tank Management")
-        print("2. Fish Management")
-        print("3. Maintenance Logs")
-        print("4. Reports")
-        print("0. Exit")
+        sys.stdout.write(_MAIN_MENU)
         return input("\nEnter choice: ").strip()
 
+    def _filter_by_name(self, items: list) -> list:
+        """Let the user narrow a long selection list by name substring."""
+        if len(items) <= _FILTER_THRESHOLD:
+            return items
+        query = input(f"Filter by name ({len(items)} total, Enter for all): ").strip()
+        if not query:
+            return items
+        query = query.lower()
+        return [item for item in items if query in item.name.lower()]
+
+    def _emit(self, lines: list[str]) -> None:
+        """Write a screen of output in one call instead of one per line."""
+        sys.stdout.write("\n".join(lines) + "\n")
+
     # ==================== Tank Management ====================
 
     def _tank_menu(self) -> None:
         """Tank management submenu."""
         while True:
-            print("\n--- Tank Management ---")
-            print("1. View All Tanks")
-            print("2. Add Tank")
-            print("3. Edit Tank")
-            print("4. Delete Tank")
-            print("5. View Tank Details")
-            print("0. Back")
+            sys.stdout.write(_TANK_MENU)
 
             choice = input("\nEnter choice: ").strip()
             if choice == "0":
@@ -81,6 +206,7 @@ class ConsoleUI:
             else:
                 print("\nInvalid choice.")
 
+    @_snapshot
     def _view_all_tanks(self) -> None:
         """Display all tanks."""
         tanks = self.tank_manager.get_all()
@@ -88,9 +214,10 @@ class ConsoleUI:
             print("\nNo tanks found. Add one to get started!")
             return
 
+        fish_counts = self.fish_manager.counts_by_tank()
         print("\n--- All Tanks ---")
         for i, tank in enumerate(tanks, 1):
-            fish_count = len(self.fish_manager.get_by_tank(tank.id))
+            fish_count = fish_counts.get(tank.id, 0)
             print(f"{i}. {tank} - {fish_count} fish")
             if tank.location:
                 print(f"   Location: {tank.location}")
@@ -104,21 +231,21 @@ class ConsoleUI:
             print("Name is required.")
             return
 
-        try:
-            size = float(input("Size (gallons): ").strip())
-        except ValueError:
+        size = _parse_float(input("Size (gallons): "))
+        if size is None:
             print("Invalid size. Please enter a number.")
             return
 
-        print("Tank types: freshwater, saltwater, brackish")
+        valid_types = Tank.VALID_TANK_TYPES
+        print(f"Tank types: {', '.join(valid_types)}")
         tank_type = input("Tank type: ").strip().lower()
-        if tank_type not in Tank.VALID_TANK_TYPES:
-            print(f"Invalid type. Must be one of: {', '.join(Tank.VALID_TANK_TYPES)}")
+        if tank_type not in valid_types:
+            print(f"Invalid type. Must be one of: {', '.join(valid_types)}")
             return
 
         location = input("Location (optional): ").strip()
         equipment_str = input("Equipment (comma-separated, optional): ").strip()
-        equipment = [e.strip() for e in equipment_str.split(",") if e.strip()]
+        equipment = _split_csv(equipment_str)
 
         try:
             tank = Tank(
@@ -145,9 +272,8 @@ class ConsoleUI:
         name = input(f"Name [{tank.name}]: ").strip() or tank.name
 
         size_input = input(f"Size [{tank.size_gallons}]: ").strip()
-        try:
-            size = float(size_input) if size_input else tank.size_gallons
-        except ValueError:
+        size = _parse_float(size_input) if size_input else tank.size_gallons
+        if size is None:
             print("Invalid size.")
             return
 
@@ -159,10 +285,10 @@ class ConsoleUI:
             location = tank.location
 
         equipment_str = input(
-            f"Equipment [{', '.join(tank.equipment)}]: "
+            f"Equipment [{tank.equipment_str}]: "
         ).strip()
         if equipment_str:
-            equipment = [e.strip() for e in equipment_str.split(",") if e.strip()]
+            equipment = _split_csv(equipment_str)
         else:
             equipment = tank.equipment
 
@@ -183,8 +309,8 @@ class ConsoleUI:
         if not tank:
             return
 
-        fish_count = len(self.fish_manager.get_by_tank(tank.id))
-        log_count = len(self.maintenance_manager.get_by_tank(tank.id))
+        fish_count = self.fish_manager.count_by_tank(tank.id)
+        log_count = self.maintenance_manager.count_by_tank(tank.id)
 
         print(f"\nWarning: This will also delete:")
         print(f"  - {fish_count} fish")
@@ -192,48 +318,53 @@ class ConsoleUI:
 
         confirm = input("Are you sure? (yes/no): ").strip().lower()
         if confirm == "yes":
-            self.fish_manager.delete_by_tank(tank.id)
-            self.maintenance_manager.delete_by_tank(tank.id)
-            self.tank_manager.delete(tank.id)
+            with self.data_manager.transaction():
+                self.fish_manager.delete_by_tank(tank.id)
+                self.maintenance_manager.delete_by_tank(tank.id)
+                self.tank_manager.delete(tank.id)
             print(f"\nTank '{tank.name}' and all associated data deleted.")
         else:
             print("\nDeletion cancelled.")
 
+    @_snapshot
     def _view_tank_details(self) -> None:
         """View detailed information about a tank."""
         tank = self._select_tank("Select tank to view")
         if not tank:
             return
 
-        print("\n" + "=" * 40)
-        print(f"Tank: {tank.name}")
-        print("=" * 40)
-        print(f"Size: {tank.size_gallons} gallons")
-        print(f"Type: {tank.tank_type}")
-        print(f"Location: {tank.location or 'Not specified'}")
-        print(f"Equipment: {', '.join(tank.equipment) if tank.equipment else 'None'}")
+        out: list[str] = []
+        out.append("\n" + "=" * 40)
+        out.append(f"Tank: {tank.name}")
+        out.append("=" * 40)
+        out.append(f"Size: {tank.size_gallons} gallons")
+        out.append(f"Type: {tank.tank_type}")
+        out.append(f"Location: {tank.location or 'Not specified'}")
+        out.append(f"Equipment: {tank.equipment_str or 'None'}")
 
         if tank.current_parameters:
-            print(f"\nCurrent Water Parameters:")
-            print(f"  {tank.current_parameters}")
+            out.append(f"\nCurrent Water Parameters:")
+            out.append(f"  {tank.current_parameters}")
 
         # Show fish
         fish_list = self.fish_manager.get_by_tank(tank.id)
-        print(f"\nFish ({len(fish_list)}):")
+        out.append(f"\nFish ({len(fish_list)}):")
         if fish_list:
             for fish in fish_list:
-                print(f"  - {fish}")
+                out.append(f"  - {fish}")
         else:
-            print("  No fish in this tank")
+            out.append("  No fish in this tank")
 
         # Show recent logs
-        logs = self.maintenance_manager.get_by_tank(tank.id)[:5]
-        print(f"\nRecent Maintenance ({len(logs)} shown):")
+        logs = self.maintenance_manager.get_by_tank(tank.id, limit=5)
+        out.append(f"\nRecent Maintenance ({len(logs)} shown):")
         if logs:
             for log in logs:
-                print(f"  - {log}")
+                out.append(f"  - {log}")
         else:
-            print("  No maintenance logs")
+            out.append("  No maintenance logs")
+
+        self._emit(out)
 
     def _select_tank(self, prompt: str = "Select tank") -> Optional[Tank]:
         """Display tanks and let user select one."""
@@ -242,19 +373,21 @@ class ConsoleUI:
             print("\nNo tanks available.")
             return None
 
+        tanks = self._filter_by_name(tanks)
+        if not tanks:
+            print("No matching tanks.")
+            return None
+
         print(f"\n--- {prompt} ---")
         for i, tank in enumerate(tanks, 1):
             print(f"{i}. {tank}")
         print("0. Cancel")
 
-        try:
-            choice = int(input("\nEnter number: ").strip())
-            if choice == 0:
-                return None
-            if 1 <= choice <= len(tanks):
-                return tanks[choice - 1]
-        except ValueError:
-            pass
+        choice = _parse_int(input("\nEnter number: "))
+        if choice == 0:
+            return None
+        if choice is not None and 1 <= choice <= len(tanks):
+            return tanks[choice - 1]
 
         print("Invalid selection.")
         return None
@@ -264,14 +397,7 @@ class ConsoleUI:
     def _fish_menu(self) -> None:
         """Fish management submenu."""
         while True:
-            print("\n--- Fish Management ---")
-            print("1. View All Fish")
-            print("2. Add Fish")
-            print("3. Edit Fish")
-            print("4. Move Fish")
-            print("5. Update Health Status")
-            print("6. Remove Fish")
-            print("0. Back")
+            sys.stdout.write(_FISH_MENU)
 
             choice = input("\nEnter choice: ").strip()
             if choice == "0":
@@ -291,6 +417,7 @@ class ConsoleUI:
             else:
                 print("\nInvalid choice.")
 
+    @_snapshot
     def _view_all_fish(self) -> None:
         """Display all fish grouped by tank."""
         tanks = self.tank_manager.get_all()
@@ -298,9 +425,10 @@ class ConsoleUI:
             print("\nNo tanks found. Add a tank first!")
             return
 
+        fish_by_tank = self.fish_manager.group_by_tank()
         total_fish = 0
         for tank in tanks:
-            fish_list = self.fish_manager.get_by_tank(tank.id)
+            fish_list = fish_by_tank.get(tank.id, ())
             print(f"\n--- {tank.name} ({len(fish_list)} fish) ---")
             if fish_list:
                 for fish in fish_list:
@@ -388,6 +516,7 @@ class ConsoleUI:
         self.fish_manager.update(fish)
         print("\nFish updated successfully!")
 
+    @_snapshot
     def _move_fish(self) -> None:
         """Move a fish to a different tank."""
         fish = self._select_fish("Select fish to move")
@@ -414,21 +543,21 @@ class ConsoleUI:
         if not fish:
             return
 
+        statuses = Fish.VALID_HEALTH_STATUSES
         print(f"\nCurrent status: {fish.health_status}")
         print("Available statuses:")
-        for i, status in enumerate(Fish.VALID_HEALTH_STATUSES, 1):
+        for i, status in enumerate(statuses, 1):
             print(f"  {i}. {status}")
 
-        try:
-            choice = int(input("\nSelect new status: ").strip())
-            if 1 <= choice <= len(Fish.VALID_HEALTH_STATUSES):
-                new_status = Fish.VALID_HEALTH_STATUSES[choice - 1]
-                self.fish_manager.update_health_status(fish.id, new_status)
-                print(f"\n{fish.name}'s status updated to: {new_status}")
-            else:
-                print("Invalid selection.")
-        except ValueError:
+        choice = _parse_int(input("\nSelect new status: "))
+        if choice is None:
             print("Invalid input.")
+        elif 1 <= choice <= len(statuses):
+            new_status = statuses[choice - 1]
+            self.fish_manager.update_health_status(fish.id, new_status)
+            print(f"\n{fish.name}'s status updated to: {new_status}")
+        else:
+            print("Invalid selection.")
 
     def _remove_fish(self) -> None:
         """Remove a fish."""
@@ -450,21 +579,23 @@ class ConsoleUI:
             print("\nNo fish available.")
             return None
 
+        all_fish = self._filter_by_name(all_fish)
+        if not all_fish:
+            print("No matching fish.")
+            return None
+
+        tank_names = self.tank_manager.names_by_id()
         print(f"\n--- {prompt} ---")
         for i, fish in enumerate(all_fish, 1):
-            tank = self.tank_manager.get_by_id(fish.tank_id)
-            tank_name = tank.name if tank else "Unknown"
+            tank_name = tank_names.get(fish.tank_id, "Unknown")
             print(f"{i}. {fish} - Tank: {tank_name}")
         print("0. Cancel")
 
-        try:
-            choice = int(input("\nEnter number: ").strip())
-            if choice == 0:
-                return None
-            if 1 <= choice <= len(all_fish):
-                return all_fish[choice - 1]
-        except ValueError:
-            pass
+        choice = _parse_int(input("\nEnter number: "))
+        if choice == 0:
+            return None
+        if choice is not None and 1 <= choice <= len(all_fish):
+            return all_fish[choice - 1]
 
         print("Invalid selection.")
         return None
@@ -474,15 +605,7 @@ class ConsoleUI:
     def _maintenance_menu(self) -> None:
         """Maintenance logs submenu."""
         while True:
-            print("\n--- Maintenance Logs ---")
-            print("1. View Recent Logs")
-            print("2. Log Water Change")
-            print("3. Log Feeding")
-            print("4. Log Water Test")
-            print("5. Log Filter Cleaning")
-            print("6. Log Equipment Check")
-            print("7. Log Medication")
-            print("0. Back")
+            sys.stdout.write(_MAINTENANCE_MENU)
 
             choice = input("\nEnter choice: ").strip()
             if choice == "0":
@@ -504,6 +627,7 @@ class ConsoleUI:
             else:
                 print("\nInvalid choice.")
 
+    @_snapshot
     def _view_recent_logs(self) -> None:
         """View recent maintenance logs."""
         logs = self.maintenance_manager.get_recent(20)
@@ -511,10 +635,10 @@ class ConsoleUI:
             print("\nNo maintenance logs found.")
             return
 
+        tank_names = self.tank_manager.names_by_id()
         print("\n--- Recent Maintenance Logs ---")
         for log in logs:
-            tank = self.tank_manager.get_by_id(log.tank_id)
-            tank_name = tank.name if tank else "Unknown"
+            tank_name = tank_names.get(log.tank_id, "Unknown")
             print(f"[{tank_name}] {log}")
             if log.water_params:
                 print(f"    Parameters: {log.water_params}")
@@ -525,10 +649,7 @@ class ConsoleUI:
         if not tank:
             return
 
-        try:
-            percentage = int(input("Water change percentage: ").strip())
-        except ValueError:
-            percentage = None
+        percentage = _parse_int(input("Water change percentage: "))
 
         description = input("Notes (optional): ").strip()
         log = self.maintenance_manager.log_water_change(tank.id, description, percentage)
@@ -555,50 +676,15 @@ class ConsoleUI:
 
         print("\nEnter water parameters (press Enter to skip):")
 
-        params = {}
-
-        temp = input("Temperature (F): ").strip()
-        if temp:
-            try:
-                params["temperature"] = float(temp)
-            except ValueError:
-                pass
-
-        ph = input("pH: ").strip()
-        if ph:
-            try:
-                params["ph"] = float(ph)
-            except ValueError:
-                pass
-
-        ammonia = input("Ammonia (ppm): ").strip()
-        if ammonia:
-            try:
-                params["ammonia"] = float(ammonia)
-            except ValueError:
-                pass
-
-        nitrite = input("Nitrite (ppm): ").strip()
-        if nitrite:
-            try:
-                params["nitrite"] = float(nitrite)
-            except ValueError:
-                pass
-
-        nitrate = input("Nitrate (ppm): ").strip()
-        if nitrate:
-            try:
-                params["nitrate"] = float(nitrate)
-            except ValueError:
-                pass
-
+        prompts = _WATER_TEST_PROMPTS
         if tank.tank_type == "saltwater":
-            salinity = input("Salinity (ppt): ").strip()
-            if salinity:
-                try:
-                    params["salinity"] = float(salinity)
-                except ValueError:
-                    pass
+            prompts += (("salinity", "Salinity (ppt): "),)
+
+        params = {}
+        for field, prompt in prompts:
+            value = _parse_float(input(prompt))
+            if value is not None:
+                params[field] = value
 
         notes = input("Notes (optional): ").strip()
 
@@ -656,11 +742,7 @@ class ConsoleUI:
     def _reports_menu(self) -> None:
         """Reports submenu."""
         while True:
-            print("\n--- Reports ---")
-            print("1. Tank Summary")
-            print("2. Maintenance History")
-            print("3. Water Parameter Trends")
-            print("0. Back")
+            sys.stdout.write(_REPORTS_MENU)
 
             choice = input("\nEnter choice: ").strip()
             if choice == "0":
@@ -674,6 +756,7 @@ class ConsoleUI:
             else:
                 print("\nInvalid choice.")
 
+    @_snapshot
     def _tank_summary(self) -> None:
         """Display summary of all tanks."""
         tanks = self.tank_manager.get_all()
@@ -681,70 +764,68 @@ class ConsoleUI:
             print("\nNo tanks to summarize.")
             return
 
-        print("\n" + "=" * 50)
-        print("           TANK SUMMARY REPORT")
-        print("=" * 50)
+        out: list[str] = []
+        out.append("\n" + "=" * 50)
+        out.append("           TANK SUMMARY REPORT")
+        out.append("=" * 50)
 
+        health_by_tank = self.fish_manager.health_counts_by_tank()
+        log_stats = self.maintenance_manager.stats_by_tank()
         total_fish = 0
         total_gallons = 0
 
         for tank in tanks:
-            fish_list = self.fish_manager.get_by_tank(tank.id)
-            fish_count = len(fish_list)
-            healthy = sum(1 for f in fish_list if f.health_status == "healthy")
-            sick = sum(1 for f in fish_list if f.health_status == "sick")
-            logs = self.maintenance_manager.get_by_tank(tank.id)
-            last_maintenance = logs[0].date.strftime("%Y-%m-%d") if logs else "Never"
-
-            print(f"\n{tank.name}")
-            print("-" * 30)
-            print(f"  Size: {tank.size_gallons} gallons ({tank.tank_type})")
-            print(f"  Location: {tank.location or 'Not specified'}")
-            print(f"  Fish: {fish_count} total ({healthy} healthy, {sick} sick)")
-            print(f"  Last maintenance: {last_maintenance}")
+            statuses = health_by_tank.get(tank.id, {})
+            fish_count = sum(statuses.values())
+            healthy = statuses.get("healthy", 0)
+            sick = statuses.get("sick", 0)
+            _, last_date = log_stats.get(tank.id, (0, None))
+            last_maintenance = last_date.strftime("%Y-%m-%d") if last_date else "Never"
+
+            out.append(f"\n{tank.name}")
+            out.append("-" * 30)
+            out.append(f"  Size: {tank.size_gallons} gallons ({tank.tank_type})")
+            out.append(f"  Location: {tank.location or 'Not specified'}")
+            out.append(f"  Fish: {fish_count} total ({healthy} healthy, {sick} sick)")
+            out.append(f"  Last maintenance: {last_maintenance}")
 
             total_fish += fish_count
             total_gallons += tank.size_gallons
 
-        print("\n" + "=" * 50)
-        print(f"TOTALS: {len(tanks)} tanks, {total_gallons} gallons, {total_fish} fish")
-        print("=" * 50)
+        out.append("\n" + "=" * 50)
+        out.append(f"TOTALS: {len(tanks)} tanks, {total_gallons} gallons, {total_fish} fish")
+        out.append("=" * 50)
+
+        self._emit(out)
 
+    @_snapshot
     def _maintenance_history(self) -> None:
         """Display maintenance history for a tank."""
         tank = self._select_tank("Select tank for history")
         if not tank:
             return
 
-        logs = self.maintenance_manager.get_by_tank(tank.id)
-        if not logs:
+        by_type = self.maintenance_manager.activity_counts(tank.id)
+        if not by_type:
             print(f"\nNo maintenance history for {tank.name}.")
             return
 
-        print(f"\n--- Maintenance History: {tank.name} ---")
-        print(f"Total entries: {len(logs)}\n")
-
-        # Group by activity type
-        by_type: dict[str, int] = {}
-        for log in logs:
-            by_type[log.activity_type] = by_type.get(log.activity_type, 0) + 1
+        out: list[str] = []
+        out.append(f"\n--- Maintenance History: {tank.name} ---")
+        out.append(f"Total entries: {sum(by_type.values())}\n")
 
-        print("Activity breakdown:")
+        out.append("Activity breakdown:")
         for activity, count in sorted(by_type.items()):
-            display_name = {
-                "water_change": "Water Changes",
-                "filter_clean": "Filter Cleanings",
-                "feeding": "Feedings",
-                "water_test": "Water Tests",
-                "equipment_check": "Equipment Checks",
-                "medication": "Medications",
-            }.get(activity, activity)
-            print(f"  {display_name}: {count}")
-
-        print("\nRecent entries:")
-        for log in logs[:10]:
-            print(f"  {log}")
+            display_name = _ACTIVITY_DISPLAY_NAMES.get(activity, activity)
+            out.append(f"  {display_name}: {count}")
+
+        out.append("\nRecent entries:")
+        for log in self.maintenance_manager.get_by_tank(tank.id, limit=10):
+            out.append(f"  {log}")
+
+        self._emit(out)
 
+    @_snapshot
     def _water_param_trends(self) -> None:
         """Display water parameter history for a tank."""
         tank = self._select_tank("Select tank for water trends")
@@ -756,28 +837,27 @@ class ConsoleUI:
             print(f"\nNo water test data for {tank.name}.")
             return
 
-        print(f"\n--- Water Parameter Trends: {tank.name} ---")
-        print(f"Last {len(params_history)} tests:\n")
+        out: list[str] = []
+        out.append(f"\n--- Water Parameter Trends: {tank.name} ---")
+        out.append(f"Last {len(params_history)} tests:\n")
 
         for params in params_history:
-            print(f"  {params}")
+            out.append(f"  {params}")
 
         # Show averages if we have data
         if len(params_history) > 1:
-            print("\nAverages:")
-            temps = [p.temperature for p in params_history if p.temperature is not None]
-            phs = [p.ph for p in params_history if p.ph is not None]
-            ammonias = [p.ammonia for p in params_history if p.ammonia is not None]
-            nitrites = [p.nitrite for p in params_history if p.nitrite is not None]
-            nitrates = [p.nitrate for p in params_history if p.nitrate is not None]
-
-            if temps:
-                print(f"  Temperature: {sum(temps) / len(temps):.1f}F")
-            if phs:
-                print(f"  pH: {sum(phs) / len(phs):.2f}")
-            if ammonias:
-                print(f"  Ammonia: {sum(ammonias) / len(ammonias):.2f} ppm")
-            if nitrites:
-                print(f"  Nitrite: {sum(nitrites) / len(nitrites):.2f} ppm")
-            if nitrates:
-                print(f"  Nitrate: {sum(nitrates) / len(nitrates):.1f} ppm")
+            out.append("\nAverages:")
+            sums = dict.fromkeys(_AVERAGE_FORMATS, 0.0)
+            counts = dict.fromkeys(_AVERAGE_FORMATS, 0)
+            for params in params_history:
+                for field in _AVERAGE_FORMATS:
+                    value = getattr(params, field)
+                    if value is not None:
+                        sums[field] += value
+                        counts[field] += 1
+
+            for field, line in _AVERAGE_FORMATS.items():
+                if counts[field]:
+                    out.append(line.format(sums[field] / counts[field]))
+
+        self._emit(out)